@@ -1,15 +1,18 @@
 import os
 import asyncio
-import webbrowser
-from typing import TYPE_CHECKING, Any, cast
+import concurrent.futures
+import re
+import time
+from collections.abc import Callable, Coroutine
+from functools import cache, partial
+from http import HTTPStatus
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, TypeVar
 
-import requests
-from packaging.version import parse as version_parse
 from PySide6 import QtCore, QtWidgets
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QBrush, QPalette
+from PySide6.QtCore import QSignalBlocker, Qt
+from PySide6.QtGui import QBrush, QColor, QPalette
 from PySide6.QtWidgets import QFileDialog
-from requests.exceptions import RequestException
 from typing_extensions import override
 
 import error_messages
@@ -29,7 +32,115 @@ from utils import AUTOSPLIT_VERSION, GITHUB_REPOSITORY, decimal, fire_and_forget
 if TYPE_CHECKING:
     from AutoSplit import AutoSplit
 
+_T = TypeVar("_T")
+
 HALF_BRIGHTNESS = 128
+VIDEO_CAPTURE_DEVICES_TIMEOUT = 10
+"""How long, in seconds, to wait for video capture devices enumeration before giving up"""
+LATEST_VERSION_CACHE_DURATION = 6 * 60 * 60
+"""How long, in seconds, the latest version is trusted before asking GitHub again when checking on open"""
+_RELEASE_TAG_REGEX = re.compile(rb'"tag_name"\s*:\s*"([^"\\]*)"')
+"""
+The tag of a GitHub release payload. Unlike "name", it is unique to the release (assets don't have one),
+can't be null, and git doesn't allow backslashes in tags so there's no escaped character to handle.
+"""
+
+
+@cache
+def _get_http_session():
+    """
+    Reused across update checks so the connection to api.github.com can be kept alive.
+    `requests` is only imported on first use as it is slow to import and not needed on startup.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update({
+        "Accept": "application/vnd.github+json",
+        "User-Agent": f"AutoSplit/{AUTOSPLIT_VERSION}",
+    })
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+    return session
+
+
+def _start_event_loop_thread():
+    loop = asyncio.new_event_loop()
+    Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+class _BackgroundEventLoop:
+    """
+    Persistent event loop running in a daemon thread,
+    so callers don't have to create and tear down their own with `asyncio.run`.
+    """
+
+    def __init__(self):
+        self.__loop = _start_event_loop_thread()
+        self.__lock = Lock()
+
+    def run(self, coroutine: Coroutine[Any, Any, _T], timeout: float) -> _T:
+        """Raises `concurrent.futures.TimeoutError` if `coroutine` doesn't complete within `timeout` seconds."""
+        loop = self.__loop
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # A coroutine stuck in a blocking call can't be cancelled and keeps its loop busy forever.
+            # Abandon that loop (its thread is a daemon) so later calls get a fresh one.
+            with self.__lock:
+                if self.__loop is loop:
+                    self.__loop = _start_event_loop_thread()
+            raise
+
+
+_BACKGROUND_EVENT_LOOP = _BackgroundEventLoop()
+
+
+# CAPTURE_METHODS doesn't change for the lifetime of the process
+_CAPTURE_METHOD_ITEMS = [
+    f"- {method.name} ({method.short_description})"
+    for method in CAPTURE_METHODS.values()
+]
+_CAPTURE_METHOD_TOOLTIP = "\n\n".join([
+    f"{method.name} :\n{method.description}"
+    for method in CAPTURE_METHODS.values()
+])
+
+_WINDTRACKER_DIRECTORY_MAP = {
+    "Speed": ("windtracker_speed_image_directory", "windtracker_speed_image_folder_input"),
+    "Direction": ("windtracker_direction_image_directory", "windtracker_direction_image_folder_input"),
+}
+"""Directory type to its setting name and folder input widget name"""
+
+_WINDTRACKER_REGION_KEYS = (("windtracker_region_1", "1"), ("windtracker_region_2", "2"))
+"""Windtracker region setting names, with the suffix of their spinboxes"""
+_REGION_FIELDS = ("x", "y", "width", "height")
+
+_HOTKEY_ATTRIBUTE_NAMES: list[tuple[Hotkey, str, str, str]] = [
+    (hotkey, f"{hotkey}_input", f"set_{hotkey}_hotkey_button", f"{hotkey}_hotkey")
+    for hotkey in HOTKEYS
+]
+"""Hotkey, with its input widget, set button widget and setting names"""
+
+
+@cache
+def _get_dark_tabs_palette(window_rgba: int):
+    """
+    @return: A palette using the window color for the tabs' button role, or None if not a dark theme.
+    The theme doesn't change while running, so this is only built once.
+    """
+    window_color = QColor.fromRgba(window_rgba)
+    if window_color.red() >= HALF_BRIGHTNESS:
+        return None
+    brush = QBrush(window_color)
+    brush.setStyle(Qt.BrushStyle.SolidPattern)
+    palette = QPalette()
+    palette.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.Button, brush)
+    palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Button, brush)
+    palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, brush)
+    return palette
 
 
 class __AboutWidget(QtWidgets.QWidget, about.Ui_AboutAutoSplitWidget):  # noqa: N801 # Private class
@@ -45,12 +156,15 @@ class __AboutWidget(QtWidgets.QWidget, about.Ui_AboutAutoSplitWidget):  # noqa:
 
 
 def open_about(autosplit: "AutoSplit"):
-    if not autosplit.AboutWidget or cast(QtWidgets.QWidget, autosplit.AboutWidget).isHidden():
+    widget = autosplit.AboutWidget
+    if not isinstance(widget, QtWidgets.QWidget) or widget.isHidden():
         autosplit.AboutWidget = __AboutWidget()
 
 
 class __UpdateCheckerWidget(QtWidgets.QWidget, update_checker.Ui_UpdateChecker):  # noqa: N801 # Private class
     def __init__(self, latest_version: str, design_window: design.Ui_MainWindow, check_on_open: bool = False):
+        from packaging.version import parse as version_parse
+
         super().__init__()
         self.setupUi(self)
         self.current_version_number_label.setText(AUTOSPLIT_VERSION)
@@ -71,6 +185,8 @@ class __UpdateCheckerWidget(QtWidgets.QWidget, update_checker.Ui_UpdateChecker):
             self.show()
 
     def open_update(self):
+        import webbrowser
+
         webbrowser.open(f"https://github.com/{GITHUB_REPOSITORY}/releases/latest")
         self.close()
 
@@ -82,11 +198,14 @@ class __UpdateCheckerWidget(QtWidgets.QWidget, update_checker.Ui_UpdateChecker):
 
 
 def open_update_checker(autosplit: "AutoSplit", latest_version: str, check_on_open: bool):
-    if not autosplit.UpdateCheckerWidget or cast(QtWidgets.QWidget, autosplit.UpdateCheckerWidget).isHidden():
+    widget = autosplit.UpdateCheckerWidget
+    if not isinstance(widget, QtWidgets.QWidget) or widget.isHidden():
         autosplit.UpdateCheckerWidget = __UpdateCheckerWidget(latest_version, autosplit, check_on_open)
 
 
 def view_help():
+    import webbrowser
+
     webbrowser.open(f"https://github.com/{GITHUB_REPOSITORY}#tutorial")
 
 
@@ -98,20 +217,60 @@ class __CheckForUpdatesThread(QtCore.QThread):  # noqa: N801 # Private class
 
     @override
     def run(self):
+        from packaging.version import InvalidVersion, parse as version_parse
+        from requests.exceptions import RequestException
+
+        cached = user_profile.load_latest_version_cache()
+        try:
+            version_parse(cached["latest_version"])
+        except InvalidVersion:
+            # Nothing cached yet, or a bad value saved by an older build. Don't trust it nor its ETag
+            cached["latest_version"] = cached["etag"] = ""
+        if (
+            self.check_on_open
+            and cached["latest_version"]
+            and time.time() - cached["checked_at"] < LATEST_VERSION_CACHE_DURATION
+        ):
+            self.autosplit.update_checker_widget_signal.emit(cached["latest_version"], self.check_on_open)
+            return
+
         try:
-            response = requests.get(f"https://api.github.com/repos/{GITHUB_REPOSITORY}/releases/latest", timeout=30)
-            latest_version = str(response.json()["name"]).split("v")[1]
+            # A 304 Not Modified has no body and doesn't count against GitHub's rate limit
+            headers = {"If-None-Match": cached["etag"]} if cached["etag"] and cached["latest_version"] else {}
+            response = _get_http_session().get(
+                f"https://api.github.com/repos/{GITHUB_REPOSITORY}/releases/latest",
+                headers=headers,
+                timeout=30,
+            )
+            if response.status_code == HTTPStatus.NOT_MODIFIED and cached["latest_version"]:
+                latest_version = cached["latest_version"]
+            else:
+                # Only the release tag is needed, don't parse the whole payload (assets, body, etc.)
+                release_tag_match = _RELEASE_TAG_REGEX.search(response.content)
+                # No match (ie: rate limit error payload) raises an AttributeError, handled below
+                release_tag = release_tag_match.group(1).decode()  # pyright: ignore[reportOptionalMemberAccess]
+                latest_version = release_tag.split("v")[1]
+                # Don't cache nor show a version that can't be compared, raises InvalidVersion
+                version_parse(latest_version)
+                cached["latest_version"] = latest_version
+                cached["etag"] = response.headers.get("ETag", "")
+            cached["checked_at"] = time.time()
+            user_profile.save_latest_version_cache(cached)
             self.autosplit.update_checker_widget_signal.emit(latest_version, self.check_on_open)
-        except (RequestException, KeyError):
+        except (RequestException, AttributeError, IndexError, InvalidVersion):
             if not self.check_on_open:
                 self.autosplit.show_error_signal.emit(error_messages.check_for_updates)
 
 
 def about_qt():
+    import webbrowser
+
     webbrowser.open("https://wiki.qt.io/About_Qt")
 
 
 def about_qt_for_python():
+    import webbrowser
+
     webbrowser.open("https://wiki.qt.io/Qt_for_Python")
 
 
@@ -120,6 +279,15 @@ def check_for_updates(autosplit: "AutoSplit", check_on_open: bool = False):
     autosplit.CheckForUpdatesThread.start()
 
 
+def _format_capture_device(device: CameraInfo):
+    parts = [f"* {device.name}"]
+    if device.backend:
+        parts.append(f" [{device.backend}]")
+    if device.occupied:
+        parts.append(" (occupied)")
+    return "".join(parts)
+
+
 class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noqa: N801 # Private class
     def __init__(self, autosplit: "AutoSplit"):
         super().__init__()
@@ -132,15 +300,9 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
         self.setupUi(self)
 
         # Fix Fusion Dark Theme's tabs content looking weird because it's using the button role
-        window_color = self.palette().color(QPalette.ColorRole.Window)
-        if window_color.red() < HALF_BRIGHTNESS:
-            brush = QBrush(window_color)
-            brush.setStyle(Qt.BrushStyle.SolidPattern)
-            palette = QPalette()
-            palette.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.Button, brush)
-            palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Button, brush)
-            palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, brush)
-            self.settings_tabs.setPalette(palette)
+        dark_tabs_palette = _get_dark_tabs_palette(self.palette().color(QPalette.ColorRole.Window).rgba())
+        if dark_tabs_palette is not None:
+            self.settings_tabs.setPalette(dark_tabs_palette)
 
         self.autosplit = autosplit
         self.__set_readme_link()
@@ -148,7 +310,6 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
         self.setFocus()
 
 # region Build the Capture method combobox
-        capture_method_values = CAPTURE_METHODS.values()
         self.__set_all_capture_devices()
 
         # TODO: Word-wrapping works, but there's lots of extra padding to the right. Raise issue upstream
@@ -158,16 +319,8 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
         # list_view.setFixedWidth(self.capture_method_combobox.width())
         # self.capture_method_combobox.setView(list_view)
 
-        self.capture_method_combobox.addItems([
-            f"- {method.name} ({method.short_description})"
-            for method in capture_method_values
-        ])
-        self.capture_method_combobox.setToolTip(
-            "\n\n".join([
-                f"{method.name} :\n{method.description}"
-                for method in capture_method_values
-            ]),
-        )
+        self.capture_method_combobox.addItems(_CAPTURE_METHOD_ITEMS)
+        self.capture_method_combobox.setToolTip(_CAPTURE_METHOD_TOOLTIP)
 # endregion
 
         self.__setup_bindings()
@@ -190,6 +343,9 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
     def __set_value(self, key: str, value: Any):
         self.autosplit.settings_dict[key] = value
 
+    def __set_region_value(self, region_key: str, field: str, value: int):
+        self.autosplit.settings_dict[region_key][field] = value
+
     def get_capture_device_index(self, capture_device_id: int):
         """Returns 0 if the capture_device_id is invalid."""
         try:
@@ -231,21 +387,23 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
             change_capture_method(CaptureMethodEnum.VIDEO_CAPTURE_DEVICE, self.autosplit)
 
     def __fps_limit_changed(self, value: int):
-        value = self.fps_limit_spinbox.value()
         self.autosplit.settings_dict["fps_limit"] = value
-        self.autosplit.timer_live_image.setInterval(int(1000 / value))
-        self.autosplit.timer_live_image.setInterval(int(1000 / value))
+        self.autosplit.timer_live_image.setInterval(1000 // value)
 
     @fire_and_forget
     def __set_all_capture_devices(self):
-        self.__video_capture_devices = asyncio.run(get_all_video_capture_devices())
+        try:
+            # A broken driver can hang the probe indefinitely, don't wait on it forever
+            self.__video_capture_devices = _BACKGROUND_EVENT_LOOP.run(
+                get_all_video_capture_devices(),
+                VIDEO_CAPTURE_DEVICES_TIMEOUT,
+            )
+        except concurrent.futures.TimeoutError:
+            self.__video_capture_devices = []
         if len(self.__video_capture_devices) > 0:
-            for i in range(self.capture_device_combobox.count()):
-                self.capture_device_combobox.removeItem(i)
+            self.capture_device_combobox.clear()
             self.capture_device_combobox.addItems([
-                f"* {device.name}"
-                + (f" [{device.backend}]" if device.backend else "")
-                + (" (occupied)" if device.occupied else "")
+                _format_capture_device(device)
                 for device in self.__video_capture_devices
             ])
             self.__enable_capture_device_if_its_selected_method()
@@ -260,54 +418,71 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
         )
         # HACK: This is a workaround because custom_image_settings_info_label
         # simply will not open links with a left click no matter what we tried.
-        self.readme_link_button.clicked.connect(
-            lambda: webbrowser.open(f"https://github.com/{GITHUB_REPOSITORY}#readme"),
-        )
+        self.readme_link_button.clicked.connect(self.__open_readme)
         self.readme_link_button.setStyleSheet("border: 0px; background-color:rgba(0,0,0,0%);")
 
+    def __open_readme(self):
+        import webbrowser
+
+        webbrowser.open(f"https://github.com/{GITHUB_REPOSITORY}#readme")
+
+    def __get_existing_directory(self, caption: str, directory: str, callback: Callable[[str], object]):
+        """
+        Non-blocking equivalent of `QFileDialog.getExistingDirectory`.
+        The dialog is opened without a nested event loop, `callback` is then called
+        with the selected directory, or an empty string if cancelled.
+        """
+        dialog = QFileDialog(self, caption, directory)
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def on_finished(result: int):
+            selected_files = dialog.selectedFiles()
+            callback(selected_files[0] if result == QFileDialog.DialogCode.Accepted and selected_files else "")
+
+        dialog.finished.connect(on_finished)
+        dialog.open()
+
     def __select_screenshot_directory(self):
-        self.autosplit.settings_dict["screenshot_directory"] = QFileDialog.getExistingDirectory(
-            self,
+        self.__get_existing_directory(
             "Select Screenshots Directory",
             self.autosplit.settings_dict["screenshot_directory"]
             or self.autosplit.settings_dict["split_image_directory"],
+            self.__screenshot_directory_selected,
         )
+
+    def __screenshot_directory_selected(self, new_directory: str):
+        self.autosplit.settings_dict["screenshot_directory"] = new_directory
         self.screenshot_directory_input.setText(self.autosplit.settings_dict["screenshot_directory"])
 
     def __select_windtracker_image_directory(self, dir_type: str):
         # User selects the file with the split images in it.
+        setting, input_attr = _WINDTRACKER_DIRECTORY_MAP[dir_type]
 
-        if dir_type == "Speed":
-            setting = "windtracker_speed_image_directory"
-        elif dir_type == "Direction":
-            setting = "windtracker_direction_image_directory"
+        def windtracker_image_directory_selected(new_directory: str):
+            # If the user doesn't select a folder, it defaults to "".
+            if new_directory:
+                # set the split image folder line to the directory text
+                self.autosplit.settings_dict[setting] = new_directory
+                folder_input: QtWidgets.QLineEdit = getattr(self, input_attr)
+                folder_input.setText(f"{new_directory}/")
 
-        new_directory = QFileDialog.getExistingDirectory(
-            self,
+        self.__get_existing_directory(
             f"Select windtracker {dir_type} Image Directory",
-            os.path.join(self.autosplit.settings_dict[setting]
-                         or auto_split_directory, ".."),
+            os.path.dirname(self.autosplit.settings_dict[setting] or auto_split_directory),
+            windtracker_image_directory_selected,
         )
 
-        # If the user doesn't select a folder, it defaults to "".
-        if new_directory:
-            # set the split image folder line to the directory text
-            self.autosplit.settings_dict[setting] = new_directory
-
-            if dir_type == "Speed":
-                self.windtracker_speed_image_folder_input.setText(f"{new_directory}/")
-            elif dir_type == "Direction":
-                self.windtracker_direction_image_folder_input.setText(f"{new_directory}/")
-
     def __setup_bindings(self):
         # Hotkey initial values and bindings
         def hotkey_connect(hotkey: Hotkey):
             return lambda: set_hotkey(self.autosplit, hotkey)
 
-        for hotkey in HOTKEYS:
-            hotkey_input: QtWidgets.QLineEdit = getattr(self, f"{hotkey}_input")
-            set_hotkey_hotkey_button: QtWidgets.QPushButton = getattr(self, f"set_{hotkey}_hotkey_button")
-            hotkey_input.setText(self.autosplit.settings_dict.get(f"{hotkey}_hotkey", ""))
+        for hotkey, input_name, button_name, setting_name in _HOTKEY_ATTRIBUTE_NAMES:
+            hotkey_input: QtWidgets.QLineEdit = getattr(self, input_name)
+            set_hotkey_hotkey_button: QtWidgets.QPushButton = getattr(self, button_name)
+            hotkey_input.setText(self.autosplit.settings_dict.get(setting_name, ""))
 
             set_hotkey_hotkey_button.clicked.connect(hotkey_connect(hotkey))
             # Make it very clear that hotkeys are not used when auto-controlled
@@ -347,15 +522,12 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
 
 
 
-        self.windtracker_x_spinbox_1.setValue(self.autosplit.settings_dict["windtracker_region_1"]["x"])
-        self.windtracker_y_spinbox_1.setValue(self.autosplit.settings_dict["windtracker_region_1"]["y"])
-        self.windtracker_width_spinbox_1.setValue(self.autosplit.settings_dict["windtracker_region_1"]["width"])
-        self.windtracker_height_spinbox_1.setValue(self.autosplit.settings_dict["windtracker_region_1"]["height"])
-
-        self.windtracker_x_spinbox_2.setValue(self.autosplit.settings_dict["windtracker_region_2"]["x"])
-        self.windtracker_y_spinbox_2.setValue(self.autosplit.settings_dict["windtracker_region_2"]["y"])
-        self.windtracker_width_spinbox_2.setValue(self.autosplit.settings_dict["windtracker_region_2"]["width"])
-        self.windtracker_height_spinbox_2.setValue(self.autosplit.settings_dict["windtracker_region_2"]["height"])
+        # Block signals so that reordering the bindings can't make these fire a slot per value set
+        for region_key, suffix in _WINDTRACKER_REGION_KEYS:
+            for field in _REGION_FIELDS:
+                spinbox: QtWidgets.QSpinBox = getattr(self, f"windtracker_{field}_spinbox_{suffix}")
+                with QSignalBlocker(spinbox):
+                    spinbox.setValue(self.autosplit.settings_dict[region_key][field])
 
 
 
@@ -434,95 +606,16 @@ class __SettingsWidget(QtWidgets.QWidget, settings_ui.Ui_SettingsWidget):  # noq
 
 
 
-        self.windtracker_x_spinbox_1.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_1", {
-                "x": self.windtracker_x_spinbox_1.value(),
-                "y": self.windtracker_y_spinbox_1.value(),
-                "width": self.windtracker_width_spinbox_1.value(),
-                "height": self.windtracker_height_spinbox_1.value(),
-            }),
-        )
-
-        self.windtracker_y_spinbox_1.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_1", {
-                "x": self.windtracker_x_spinbox_1.value(),
-                "y": self.windtracker_y_spinbox_1.value(),
-                "width": self.windtracker_width_spinbox_1.value(),
-                "height": self.windtracker_height_spinbox_1.value(),
-            }),
-        )
-
-        self.windtracker_width_spinbox_1.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_1", {
-                "x": self.windtracker_x_spinbox_1.value(),
-                "y": self.windtracker_y_spinbox_1.value(),
-                "width": self.windtracker_width_spinbox_1.value(),
-                "height": self.windtracker_height_spinbox_1.value(),
-            }),
-        )
-
-        self.windtracker_height_spinbox_1.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_1", {
-                "x": self.windtracker_x_spinbox_1.value(),
-                "y": self.windtracker_y_spinbox_1.value(),
-                "width": self.windtracker_width_spinbox_1.value(),
-                "height": self.windtracker_height_spinbox_1.value(),
-            }),
-        )
-
-        self.windtracker_x_spinbox_2.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_2", {
-                "x": self.windtracker_x_spinbox_2.value(),
-                "y": self.windtracker_y_spinbox_2.value(),
-                "width": self.windtracker_width_spinbox_2.value(),
-                "height": self.windtracker_height_spinbox_2.value(),
-            }),
-        )
-
-        self.windtracker_y_spinbox_2.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_2", {
-                "x": self.windtracker_x_spinbox_2.value(),
-                "y": self.windtracker_y_spinbox_2.value(),
-                "width": self.windtracker_width_spinbox_2.value(),
-                "height": self.windtracker_height_spinbox_2.value(),
-            }),
-        )
-
-        self.windtracker_width_spinbox_2.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_2", {
-                "x": self.windtracker_x_spinbox_2.value(),
-                "y": self.windtracker_y_spinbox_2.value(),
-                "width": self.windtracker_width_spinbox_2.value(),
-                "height": self.windtracker_height_spinbox_2.value(),
-            }),
-        )
-
-        self.windtracker_height_spinbox_2.valueChanged.connect(
-            lambda: self.__set_value("windtracker_region_2", {
-                "x": self.windtracker_x_spinbox_2.value(),
-                "y": self.windtracker_y_spinbox_2.value(),
-                "width": self.windtracker_width_spinbox_2.value(),
-                "height": self.windtracker_height_spinbox_2.value(),
-            }),
-        )
-
-
-
-
-
-
-
-
-
-
-
-
-
+        for region_key, suffix in _WINDTRACKER_REGION_KEYS:
+            for field in _REGION_FIELDS:
+                spinbox = getattr(self, f"windtracker_{field}_spinbox_{suffix}")
+                spinbox.valueChanged.connect(partial(self.__set_region_value, region_key, field))
 # endregion
 
 
 def open_settings(autosplit: "AutoSplit"):
-    if not autosplit.SettingsWidget or cast(QtWidgets.QWidget, autosplit.SettingsWidget).isHidden():
+    widget = autosplit.SettingsWidget
+    if not isinstance(widget, QtWidgets.QWidget) or widget.isHidden():
         autosplit.SettingsWidget = __SettingsWidget(autosplit)
 
 
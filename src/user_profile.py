@@ -1,4 +1,5 @@
 import os
+from copy import deepcopy
 from typing import TYPE_CHECKING, TypedDict, cast
 
 import toml
@@ -58,6 +59,12 @@ class UserProfileDict(TypedDict):
     windtracker_region_2: Region
 
 
+class LatestVersionCache(TypedDict):
+    latest_version: str
+    etag: str
+    checked_at: float
+
+
 DEFAULT_PROFILE = UserProfileDict(
     split_hotkey="",
     reset_hotkey="",
@@ -156,7 +163,8 @@ def __load_settings_from_file(autosplit: "AutoSplit", load_settings_file_path: s
             loaded_settings = cast(
                 UserProfileDict,
                 {
-                    **DEFAULT_PROFILE,
+                    # Deep copy so editing a nested setting (like a region) can't modify the defaults
+                    **deepcopy(DEFAULT_PROFILE),
                     **toml.load(file),
                 },
             )
@@ -258,3 +266,23 @@ def set_check_for_updates_on_open(design_window: design.Ui_MainWindow, value: bo
     QtCore \
         .QSettings("AutoSplit", "Check For Updates On Open") \
         .setValue("check_for_updates_on_open", value)
+
+
+def load_latest_version_cache():
+    """
+    Retrieve the result of the last successful "Check For Updates" from QSettings.
+    These are only global settings values. They are not *toml settings values.
+    """
+    settings = QtCore.QSettings("AutoSplit", "Latest Version Cache")
+    return LatestVersionCache(
+        latest_version=cast(str, settings.value("latest_version", "", type=str)),
+        etag=cast(str, settings.value("etag", "", type=str)),
+        checked_at=cast(float, settings.value("checked_at", 0.0, type=float)),
+    )
+
+
+def save_latest_version_cache(cache: LatestVersionCache):
+    """Sets the "Latest Version Cache" QSettings values."""
+    settings = QtCore.QSettings("AutoSplit", "Latest Version Cache")
+    for key, value in cache.items():
+        settings.setValue(key, value)